@@ -236,10 +236,9 @@ def main_cli():
                 result = echoverifier.run(target, mode="export")
                 if not args.json:
                     print("Exported Verifier Data:")
-                    print(result['export_data'])
-                else:
-                    result = json.loads(result['export_data'])
-                    print(json.dumps(result, indent=2))
+                # export_data is already indent=2 JSON; print it as-is
+                # instead of parsing and re-serializing it
+                print(result['export_data'])
                 return
 
         # Other flags (placeholders)
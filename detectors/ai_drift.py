@@ -1,34 +1,64 @@
 """AI Drift Detector Module"""
 
+from functools import lru_cache
+
 import numpy as np
 
+# Streams up to this length are memoized; repeated probes of the same
+# short text during batch analysis then skip the array work entirely.
+CACHE_MAX_LENGTH = 4096
+
+# Result for an empty stream; callers receive a copy
+_EMPTY_RESULT = {
+    "detector": "ai_drift",
+    "drift_variance": 0.0,
+    "verdict": "AI-like drift",
+    "echo_score_modifier": 1.0
+}
+
+def digit_sum(values, base):
+    """Element-wise digit sum of a non-negative integer array in the given base."""
+    values = np.array(values, dtype=np.int64)
+    sums = np.zeros_like(values)
+    while values.any():
+        values, digits = np.divmod(values, base)
+        sums += digits
+    return sums
+
+# Digit sums for every byte value, so 8-bit streams need only a table gather
+_DIGIT_SUM_LUT = {b: digit_sum(np.arange(256), b) for b in (6, 7, 8, 9)}
+
+def base_profile(ascii_vals, base):
+    """Digit-sum profile of a code point array, using the byte table when possible."""
+    if ascii_vals.max() < 256:
+        return _DIGIT_SUM_LUT[base][ascii_vals]
+    return digit_sum(ascii_vals, base)
+
+def drift_variance(ascii_vals):
+    """Mean variance of successive digit-sum differences across bases 6–9."""
+    # Needs at least two characters to have a difference
+    if ascii_vals.size < 2:
+        return 0.0
+    # One row per base
+    drift_profiles = np.stack([base_profile(ascii_vals, b) for b in (6, 7, 8, 9)])
+    return float(np.var(np.diff(drift_profiles, axis=1), axis=1).mean())
+
 def run(stream, delta_s_result=None, sbsm_result=None):
+    if (delta_s_result is None and sbsm_result is None
+            and isinstance(stream, str) and len(stream) <= CACHE_MAX_LENGTH):
+        return dict(_cached_drift(stream))
+    return _drift(stream)
+
+@lru_cache(maxsize=2048)
+def _cached_drift(stream):
+    return _drift(stream)
+
+def _drift(stream):
     if len(stream) == 0:
-        return {
-            "detector": "ai_drift",
-            "drift_variance": 0.0,
-            "verdict": "AI-like drift",
-            "echo_score_modifier": 1.0
-        }
-    
-    ascii_vals = np.array([ord(c) for c in stream])
-    # Drift across bases 6–9
-    def digit_sum(n, base): return sum(int(d) for d in np.base_repr(n, base))
-    drift_profiles = []
-    for b in [6,7,8,9]:
-        profile = [digit_sum(v, b) for v in ascii_vals]
-        drift_profiles.append(profile)
-    
-    # Calculate variance of differences, handle cases where there's not enough data
-    variances = []
-    for profile in drift_profiles:
-        if len(profile) > 1:
-            diff_profile = np.diff(profile)
-            variances.append(np.var(diff_profile))
-        else:
-            variances.append(0.0)
+        return dict(_EMPTY_RESULT)
     
-    drift_var = float(np.mean(variances)) if variances else 0.0
+    ascii_vals = np.frombuffer(stream.encode("utf-32-le", "surrogatepass"), dtype="<u4")
+    drift_var = drift_variance(ascii_vals)
     # High variance indicates unstable human-like stream,
     # Low variance (flat drift) indicates synthetic AI filler.
     if drift_var < 0.15:
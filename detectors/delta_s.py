@@ -1,10 +1,11 @@
 """Delta S drift test detector module."""
 import math
+import zlib
 
 def run(input_string: str):
     """Run delta S drift test."""
-    # Simple placeholder calculation
-    delta_s = abs(hash(input_string)) % 1000 / 100000.0
+    # Simple placeholder calculation; CRC32 keeps it reproducible across runs
+    delta_s = (zlib.crc32(input_string.encode('utf-8', 'surrogatepass')) % 1000) / 100000.0
     return {
         "delta_s": delta_s,
         "drift_score": delta_s,
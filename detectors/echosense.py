@@ -1,9 +1,10 @@
 """EchoSense Integration Hook for SBSH"""
 
-import sbsh_module
-
 def analyze_sbsh_patterns(input_text):
     """EchoSense integration point for SBSH pattern analysis"""
+    # Imported on first use so registering this hook does not pull in
+    # sbsh_module (and NumPy) at import time
+    import sbsh_module
     sbsh_result = sbsh_module.sbsh_hash(input_text)
     
     # Analyze patterns in SBSH output
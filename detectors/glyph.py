@@ -1,10 +1,26 @@
 """Glyph detector module."""
 
+import zlib
+from functools import lru_cache
+
+# Inputs up to this length have their glyph id memoized; longer inputs are
+# not kept alive by the cache.
+CACHE_MAX_LENGTH = 4096
+
+@lru_cache(maxsize=1024)
+def _glyph_id(input_data):
+    # CRC32 is stable across interpreter runs, unlike the salted hash()
+    data = input_data if isinstance(input_data, bytes) else str(input_data).encode("utf-8", "surrogatepass")
+    return f"GHX-{zlib.crc32(data) % 10000:04X}"
+
 def run(input_data=None, input_type="text", *args, **kwargs):
     """Run glyph detection.
     Accepts input_data and input_type, returns glyph id and related info."""
     if input_data is not None:
-        glyph_id = f"GHX-{abs(hash(input_data)) % 10000:04X}"
+        if isinstance(input_data, (str, bytes)) and len(input_data) <= CACHE_MAX_LENGTH:
+            glyph_id = _glyph_id(input_data)
+        else:
+            glyph_id = _glyph_id.__wrapped__(input_data)
         return {
             "glyphs": [glyph_id],
             "glyph_id": glyph_id,
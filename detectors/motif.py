@@ -1,31 +1,42 @@
 """Motif detector module for EchoScan."""
 
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from detectors.ai_drift import digit_sum
+
+# Result for an empty stream; callers receive a copy
+_EMPTY_RESULT = {
+    "detector": "motif",
+    "top_motif": "",
+    "repeat_score": 0.0,
+    "delta_s": 0.0,
+    "echo_score_modifier": 0.0
+}
 
 def run(stream):
     if len(stream) == 0:
-        return {
-            "detector": "motif",
-            "top_motif": "",
-            "repeat_score": 0.0,
-            "delta_s": 0.0,
-            "echo_score_modifier": 0.0
-        }
+        return dict(_EMPTY_RESULT)
     
     # Convert to ASCII
-    ascii_vals = np.array([ord(c) for c in stream])
+    ascii_vals = np.frombuffer(stream.encode("utf-32-le", "surrogatepass"), dtype="<u4")
     # Detect repeating motifs (3-char substrings)
-    motifs = {}
-    for i in range(len(stream)-2):
-        motif = stream[i:i+3]
-        motifs[motif] = motifs.get(motif, 0) + 1
-    top_motif = max(motifs, key=motifs.get) if motifs else ""
-    repeat_score = motifs[top_motif] / len(stream) if motifs and len(stream) > 0 else 0.0
+    # Each 3-gram is packed into one uint64 key (code points fit in 21 bits)
+    # and counted with np.unique; ties resolve to the first-seen motif.
+    top_motif = ""
+    repeat_score = 0.0
+    if ascii_vals.size >= 3:
+        windows = sliding_window_view(ascii_vals.astype(np.uint64), 3)
+        keys = (windows[:, 0] << 42) | (windows[:, 1] << 21) | windows[:, 2]
+        _, first_index, counts = np.unique(keys, return_index=True, return_counts=True)
+        top_count = counts.max()
+        pos = int(first_index[counts == top_count].min())
+        top_motif = stream[pos:pos+3]
+        repeat_score = int(top_count) / len(stream)
     # Drift stability (∆S across bases 6–9)
-    def digit_sum(n, base): return sum(int(d) for d in np.base_repr(n, base))
     drift_vals = []
     for b in [6,7,8,9]:
-        digit_sums = [digit_sum(v, b) for v in ascii_vals]
+        digit_sums = digit_sum(ascii_vals, b)
         if len(digit_sums) > 1:
             drift_vals.append(np.mean(np.abs(np.diff(digit_sums))))
         else:
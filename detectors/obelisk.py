@@ -3,18 +3,21 @@
 import numpy as np
 
 def run(stream, sbsm_result=None, delta_s_result=None):
-    # Symmetry check (mirror about center)
-    half = len(stream) // 2
-    left, right = stream[:half], stream[-half:][::-1]
+    code_points = np.frombuffer(stream.encode("utf-32-le", "surrogatepass"), dtype="<u4")
+    # Symmetry check (mirror about center): compare each half against the
+    # reversed other half in one vectorized pass
+    half = code_points.size // 2
     if half > 0:
-        symmetry_score = sum(1 for i in range(half) if left[i] == right[i]) / half
+        symmetry_score = float((code_points[:half] == code_points[::-1][:half]).mean())
     else:
         symmetry_score = 0.0
-    # Entropy calculation
-    ascii_vals = np.array([ord(c) for c in stream])
-    unique_chars = set(stream)
-    probs = [list(stream).count(ch)/len(stream) for ch in unique_chars if len(stream) > 0]
-    entropy = float(-sum([p * np.log2(p) for p in probs if p > 0])) if probs else 0.0
+    # Entropy calculation from a single code point histogram
+    if code_points.size > 0:
+        _, counts = np.unique(code_points, return_counts=True)
+        probs = counts / code_points.size
+        entropy = float(-(probs * np.log2(probs)).sum())
+    else:
+        entropy = 0.0
     return {
         "detector": "obelisk",
         "symmetry_score": round(symmetry_score, 3),
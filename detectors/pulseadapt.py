@@ -1,9 +1,10 @@
 """PulseAdapt Integration Hook for SBSH"""
 
-import sbsh_module
-
 def adaptive_pulse_analysis(input_text, previous_sbsh=None):
     """PulseAdapt integration point for SBSH adaptive analysis"""
+    # Imported on first use so registering this hook does not pull in
+    # sbsh_module (and NumPy) at import time
+    import sbsh_module
     current_sbsh = sbsh_module.sbsh_hash(input_text)
     
     adaptation_score = 0.5  # Default
@@ -6,6 +6,7 @@ base × position matrix, stability vectors, and anomaly detection.
 """
 
 import math
+from itertools import pairwise
 from typing import Dict, List, Any
 
 
@@ -41,11 +42,9 @@ def calculate_entropy_drift(digit_sums: List[int]) -> float:
     if len(digit_sums) < 2:
         return 0.0
     
-    differences = []
-    for i in range(1, len(digit_sums)):
-        differences.append(abs(digit_sums[i] - digit_sums[i-1]))
-    
-    return sum(differences) / len(differences) if differences else 0.0
+    # Single pass over adjacent pairs, without an intermediate list
+    total = sum(abs(b - a) for a, b in pairwise(digit_sums))
+    return total / (len(digit_sums) - 1)
 
 
 def create_base_position_matrix(digit_sequences: Dict[int, List[int]]) -> List[List[float]]:
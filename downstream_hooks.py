@@ -3,13 +3,20 @@ Downstream module hooks for EchoScan integration.
 These are integration points for modules mentioned in the specification.
 """
 
+import zlib
+
+
+def _stable_id(value):
+    """Process-independent numeric id (CRC32) for hook identifiers."""
+    return zlib.crc32(str(value).encode("utf-8", "surrogatepass")) % 10000
+
 # EchoSeal integration hook
 class EchoSeal:
     @staticmethod
     def drift_trace(echoverifier_result):
         """Hook for EchoSeal drift trace functionality."""
         return {
-            "drift_trace_id": f"seal_{hash(str(echoverifier_result)) % 10000:04X}",
+            "drift_trace_id": f"seal_{_stable_id(echoverifier_result):04X}",
             "trace_status": "active" if echoverifier_result.get("vault_permission") else "inactive"
         }
 
@@ -30,7 +37,7 @@ class EchoVault:
         """Hook for EchoVault secure storage."""
         if echoverifier_result.get("vault_permission"):
             return {
-                "vault_id": f"vault_{hash(echoverifier_result['glyph_id']) % 10000:04X}",
+                "vault_id": f"vault_{_stable_id(echoverifier_result['glyph_id']):04X}",
                 "storage_level": "secure",
                 "access_granted": True
             }
@@ -67,7 +74,7 @@ class RPS1:
         """Hook for RPS-1 Recursive Paradox Synthesizer."""
         paradox_score = sum(fold_vector) / len(fold_vector) if fold_vector else 0
         return {
-            "paradox_id": f"RPS1_{hash(input_data) % 10000:04X}",
+            "paradox_id": f"RPS1_{_stable_id(input_data):04X}",
             "paradox_score": paradox_score,
             "synthesis_state": "resolved" if paradox_score > 0.5 else "unresolved",
             "recursive_depth": len([v for v in fold_vector if v > 0.5])
@@ -5,6 +5,9 @@ Implements Tier-1 and Tier-0 specifications with spoof-resistance.
 
 import math
 import json
+import operator
+import zlib
+import numpy as np
 from typing import Dict, List, Any, Tuple
 from detectors import sbsm, delta_s, glyph
 from vault.vault import vault
@@ -18,12 +21,15 @@ class EchoFold:
     def generate_vector(input_data: str, hash_result: str) -> List[float]:
         """Generate EchoFold vector from input and hash."""
         # Mathematical vector generation based on input characteristics
-        vec = []
         combined = input_data + hash_result
-        for i in range(16):  # 16-dimensional vector
-            val = sum(ord(c) * (i + 1) for c in combined[i::16]) / len(combined)
-            vec.append(round(val / 255.0, 6))  # Normalize to [0,1]
-        return vec
+        if not combined:
+            return [0.0] * 16
+        # Code points laid out in rows of 16, so column i holds combined[i::16]
+        codes = np.frombuffer(combined.encode("utf-32-le", "surrogatepass"), dtype="<u4")
+        codes = np.pad(codes.astype(np.int64), (0, -len(codes) % 16))
+        # 16-dimensional vector: column i weighted by (i + 1)
+        vals = codes.reshape(-1, 16).sum(axis=0) * np.arange(1, 17) / len(combined)
+        return [round(val / 255.0, 6) for val in vals.tolist()]  # Normalize to [0,1]
     
     @staticmethod
     def cosine_similarity(vec1: List[float], vec2: List[float]) -> float:
@@ -31,9 +37,10 @@ class EchoFold:
         if len(vec1) != len(vec2):
             return 0.0
         
-        dot_product = sum(a * b for a, b in zip(vec1, vec2))
-        norm1 = math.sqrt(sum(a * a for a in vec1))
-        norm2 = math.sqrt(sum(b * b for b in vec2))
+        # map(operator.mul) keeps the products in C; summation order is unchanged
+        dot_product = sum(map(operator.mul, vec1, vec2))
+        norm1 = math.sqrt(sum(map(operator.mul, vec1, vec1)))
+        norm2 = math.sqrt(sum(map(operator.mul, vec2, vec2)))
         
         if norm1 == 0 or norm2 == 0:
             return 0.0
@@ -55,7 +62,9 @@ class GlyphFamily:
     def classify_glyph(glyph_id: str, input_data: str) -> Dict[str, Any]:
         """Classify glyph into family based on characteristics."""
         # Analysis based on glyph pattern and input characteristics
-        pattern_score = hash(glyph_id + input_data) % 1000 / 1000.0
+        # CRC32 keeps the score (and so the verdict) stable across processes
+        fingerprint = zlib.crc32((glyph_id + input_data).encode("utf-8", "surrogatepass"))
+        pattern_score = fingerprint % 1000 / 1000.0
         
         for family, config in GlyphFamily.FAMILIES.items():
             if pattern_score >= config["threshold"]:
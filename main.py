@@ -1,3 +1,13 @@
+import re
+
+# Keyword sets used to categorize module advisory flags, compiled once so each
+# flag is scanned in a single pass instead of one substring test per keyword.
+CRITICAL_KEYWORDS = ("synthetic", "extreme", "suspicious", "anomaly")
+WARNING_KEYWORDS = ("borderline", "elevated", "questionable")
+_CRITICAL_RE = re.compile("|".join(map(re.escape, CRITICAL_KEYWORDS)))
+_WARNING_RE = re.compile("|".join(map(re.escape, WARNING_KEYWORDS)))
+
+
 def compute_advisory_flags(results):
     """
     Refined advisory flag computation with comprehensive flag collection and categorization.
@@ -17,30 +27,32 @@ def compute_advisory_flags(results):
             if "advisory_flag" in module_result:
                 flag = module_result["advisory_flag"]
                 # Categorize flags based on content
-                if any(keyword in flag.lower() for keyword in ["synthetic", "extreme", "suspicious", "anomaly"]):
+                flag_lower = flag.lower()
+                if _CRITICAL_RE.search(flag_lower):
                     critical_flags.append(flag)
-                elif any(keyword in flag.lower() for keyword in ["borderline", "elevated", "questionable"]):
+                elif _WARNING_RE.search(flag_lower):
                     warning_flags.append(flag)
                 else:
                     info_flags.append(flag)
             
             # Generate flags based on module results
+            module_label = module_name.upper()
             source_class = module_result.get("source_classification")
             if source_class == "AI-Generated":
-                critical_flags.append(f"{module_name.upper()}: AI-generated content detected")
+                critical_flags.append(f"{module_label}: AI-generated content detected")
             elif source_class == "Questionable":
-                warning_flags.append(f"{module_name.upper()}: Content authenticity questioned")
+                warning_flags.append(f"{module_label}: Content authenticity questioned")
             
             # Check for significant penalties or modifiers
             penalty = module_result.get("echo_score_penalty", 0)
             modifier = module_result.get("echo_score_modifier", 0)
             
             if penalty <= -10:
-                critical_flags.append(f"{module_name.upper()}: Severe authenticity penalty applied")
+                critical_flags.append(f"{module_label}: Severe authenticity penalty applied")
             elif penalty <= -5:
-                warning_flags.append(f"{module_name.upper()}: Moderate authenticity penalty applied")
+                warning_flags.append(f"{module_label}: Moderate authenticity penalty applied")
             elif modifier >= 5:
-                info_flags.append(f"{module_name.upper()}: Authenticity bonus applied")
+                info_flags.append(f"{module_label}: Authenticity bonus applied")
     
     # Special handling for EchoVerifier results
     if "echoverifier" in results:
@@ -59,15 +71,6 @@ def compute_advisory_flags(results):
             if not vault_perm:
                 warning_flags.append("ECHOVERIFIER: Vault access denied")
     
-    # Combine flags in priority order: Critical -> Warning -> Info
-    all_flags = critical_flags + warning_flags + info_flags
-    
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_flags = []
-    for flag in all_flags:
-        if flag not in seen:
-            unique_flags.append(flag)
-            seen.add(flag)
-    
-    return unique_flags
\ No newline at end of file
+    # Combine flags in priority order: Critical -> Warning -> Info,
+    # removing duplicates while preserving order
+    return list(dict.fromkeys(critical_flags + warning_flags + info_flags))
\ No newline at end of file
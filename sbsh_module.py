@@ -15,10 +15,14 @@ Features:
 import hashlib
 import math
 import numpy as np
-from scipy.fft import dct
 import statistics
 
 
+# Output schema used by validate_sbsh_output
+SBSH_OUTPUT_KEYS = frozenset(("delta_hash", "fold_hash", "glyph_hash", "status"))
+SBSH_STATUSES = frozenset(("LOCKED", "ERROR"))
+
+
 def z_score_normalize(data):
     """
     Apply Z-score normalization to input data.
@@ -110,6 +114,10 @@ def echo_fold_dct(input_data, fold_factor=8):
     if not input_data or len(input_data) < fold_factor:
         return input_data
     
+    # scipy.fft is imported here rather than at module load: it dominates
+    # import time and is only needed once a DCT is actually computed.
+    from scipy.fft import dct
+    
     # Ensure input is numpy array
     data = np.array(input_data, dtype=float)
     
@@ -213,12 +221,10 @@ def validate_sbsh_output(result):
     Returns:
         Boolean indicating if format is valid
     """
-    required_keys = {"delta_hash", "fold_hash", "glyph_hash", "status"}
-    
     if not isinstance(result, dict):
         return False
     
-    if not all(key in result for key in required_keys):
+    if not SBSH_OUTPUT_KEYS <= result.keys():
         return False
     
     # Validate delta_hash format (should be numeric string)
@@ -237,7 +243,7 @@ def validate_sbsh_output(result):
         return False
     
     # Validate status
-    if result["status"] not in ["LOCKED", "ERROR"]:
+    if not isinstance(result["status"], str) or result["status"] not in SBSH_STATUSES:
         return False
     
     return True
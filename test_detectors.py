@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Test suite for the EchoScan detector modules
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from detectors import ai_drift, motif
+
+
+class TestMotif:
+    """Test the motif detector"""
+
+    def test_tie_resolves_to_first_seen_motif(self):
+        """Test that equally frequent 3-grams resolve to the earliest one"""
+        assert motif.run("abcabcxyzxyz")["top_motif"] == "abc"
+        assert motif.run("xyzxyzabcabc")["top_motif"] == "xyz"
+
+    def test_non_bmp_characters(self):
+        """Test that astral code points are counted as single characters"""
+        stream = "a\U0001F600b" * 3
+        result = motif.run(stream)
+        assert result["top_motif"] == "a\U0001F600b"
+        assert result["repeat_score"] == round(3 / 9, 3)
+
+    @pytest.mark.parametrize("stream", ["a", "ab"])
+    def test_stream_shorter_than_motif(self, stream):
+        """Test that streams too short for a 3-gram yield no motif"""
+        result = motif.run(stream)
+        assert result["top_motif"] == ""
+        assert result["repeat_score"] == 0.0
+        assert result["echo_score_modifier"] == 0.0
+
+
+class TestAIDrift:
+    """Test the AI drift detector"""
+
+    def test_cached_result_is_not_shared(self):
+        """Test that mutating a returned result does not leak into later calls"""
+        stream = "The quick brown fox jumps over the lazy dog"
+        first = ai_drift.run(stream)
+        expected = dict(first)
+        first["verdict"] = "tampered"
+        first["drift_variance"] = -1.0
+        assert ai_drift.run(stream) == expected
+
+    def test_cache_bypass_matches_cached_result(self):
+        """Test that passing upstream results gives the same content as the cached path"""
+        stream = "The quick brown fox jumps over the lazy dog"
+        assert ai_drift.run(stream, delta_s_result={}) == ai_drift.run(stream)
+
+    def test_cache_boundary_length(self):
+        """Test that a stream exactly at the cache limit is memoized"""
+        stream = "ab" * (ai_drift.CACHE_MAX_LENGTH // 2)
+        ai_drift._cached_drift.cache_clear()
+        ai_drift.run(stream)
+        assert ai_drift._cached_drift.cache_info().currsize == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -4,6 +4,8 @@ Validates all requirements from the problem statement.
 """
 
 import json
+import os
+import subprocess
 import echoverifier
 from cli import main_cli
 import sys
@@ -156,5 +158,24 @@ def test_echoverifier_requirements():
     
     print("\n=== EchoVerifier Validation Complete ===")
 
+
+def test_glyph_id_stable_across_processes():
+    """Verification results must not depend on the interpreter's hash seed."""
+    code = (
+        "import json, echoverifier; "
+        "r = echoverifier.run('stable id', enable_downstream=False); "
+        "print(json.dumps([r['glyph_id'], r['verdict'], r['echo_sense']]))"
+    )
+    results = set()
+    for seed in ("1", "2"):
+        env = dict(os.environ, PYTHONHASHSEED=seed)
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, cwd=os.path.dirname(os.path.abspath(__file__)))
+        assert out.returncode == 0, out.stderr
+        results.add(out.stdout.strip())
+    assert len(results) == 1
+    glyph_id, verdict, echo_sense = json.loads(results.pop())
+    assert glyph_id.startswith("GHX-")
+    assert verdict in {"Authentic", "Plausible", "Hallucination"}
+
 if __name__ == "__main__":
     test_echoverifier_requirements()
\ No newline at end of file